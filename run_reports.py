@@ -0,0 +1,577 @@
+#!/usr/bin/env python3
+"""
+Headless Report Runner
+----------------------
+Runs the analyses from the Population_Flow, Geospatial, Data_Quality,
+Homelessness and Charge notebooks (plus homeless_analysis.py) without
+starting a Jupyter kernel for each one.
+
+Execution Strategy:
+1. Load every JABookings_*/JAReleases_*.csv file once, deduplicate and add
+   the derived columns (parsed dates, ZipCode, IsHomeless, BondAmount_Clean).
+2. Write the cleaned frames as Arrow IPC files into a scratch directory
+   (on /dev/shm when available). Workers memory-map these files instead of
+   receiving pickled copies of the frames.
+3. Run each report as an independent task in a process pool. Every report
+   writes its tables (CSV) and figures (PNG) to <output>/<report name>/.
+
+A nightly run therefore costs one load plus the slowest report.
+
+Usage:
+    python run_reports.py [--output reports] [--workers N] [report ...]
+"""
+
+import argparse
+import glob
+import os
+import sys
+import tempfile
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import matplotlib
+matplotlib.use('Agg')  # No display in the worker processes
+import matplotlib.pyplot as plt
+import pandas as pd
+import pyarrow as pa
+import seaborn as sns
+
+# Keys used by the notebooks to identify a unique record
+BOOKING_CHARGE_KEYS = ['SONumber', 'CaseNumber', 'ConfineDate', 'ChargeOffenseDescription']
+BOOKING_EVENT_KEYS = ['SONumber', 'CaseNumber', 'ConfineDate']
+RELEASE_KEYS = ['SONumber', 'CaseNumber', 'ReleaseDate']
+
+MARIJUANA_CHARGE = "POSS MARIJ < 2OZ"
+
+
+# ---------------------------------------------------------------------------
+# Loading and cleaning (runs once, in the parent process)
+# ---------------------------------------------------------------------------
+
+def load_csv_files(file_pattern):
+    """
+    Reads and concatenates every CSV matching the pattern.
+    BondAmount and CaseNumber are read as strings so that files which
+    disagree on their inferred types can still be concatenated.
+    """
+    files = sorted(glob.glob(file_pattern))
+    print(f"Found {len(files)} files matching {file_pattern}.")
+
+    dfs = []
+    for f in files:
+        try:
+            dfs.append(pd.read_csv(f, dtype={'BondAmount': str, 'CaseNumber': str}))
+        except Exception as e:
+            print(f"Error reading {f}: {e}")
+
+    if not dfs:
+        return pd.DataFrame()
+    return pd.concat(dfs, ignore_index=True)
+
+
+def clean_bond(x):
+    if pd.isna(x) or str(x).strip() == '':
+        return 0.0
+    try:
+        return float(str(x).replace(',', '').replace('$', ''))
+    except ValueError:
+        return 0.0
+
+
+def add_address_columns(df):
+    """Adds the ZipCode and IsHomeless columns derived from Address1."""
+    if 'Address1' in df.columns:
+        address = df['Address1'].astype(str)
+        df['ZipCode'] = address.str.extract(r'(\d{5})', expand=False)
+        df['IsHomeless'] = address.str.contains('HOMELESS', case=False, na=False)
+    return df
+
+
+def load_dataset():
+    """
+    Loads and cleans the booking and release history.
+
+    Returns a dict of frames:
+        bookings       - one row per charge (Population Flow deduplication)
+        booking_events - one row per SONumber/CaseNumber/ConfineDate
+        releases       - one row per SONumber/CaseNumber/ReleaseDate
+        booking_missing - percent missing per source column of booking_events,
+                          measured before dates are parsed
+    """
+    bookings = load_csv_files('JABookings_*.csv')
+    releases = load_csv_files('JAReleases_*.csv')
+
+    if not bookings.empty:
+        # Deduplicate on the raw date strings, as the notebooks do, then parse
+        bookings = bookings.drop_duplicates(subset=BOOKING_CHARGE_KEYS)
+        event_mask = ~bookings.duplicated(subset=BOOKING_EVENT_KEYS)
+        # Measured on the raw columns so unparseable dates are not counted as missing
+        missing_pct = bookings[event_mask].isnull().mean() * 100
+        booking_missing = missing_pct.rename_axis('Column').reset_index(name='PercentMissing')
+        bookings['ConfineDate'] = pd.to_datetime(bookings['ConfineDate'], errors='coerce')
+        if 'BondAmount' in bookings.columns:
+            bookings['BondAmount_Clean'] = bookings['BondAmount'].apply(clean_bond)
+        bookings = add_address_columns(bookings).reset_index(drop=True)
+        booking_events = bookings[event_mask.to_numpy()].reset_index(drop=True)
+    else:
+        booking_events = pd.DataFrame()
+        booking_missing = pd.DataFrame(columns=['Column', 'PercentMissing'])
+
+    if not releases.empty:
+        releases = releases.drop_duplicates(subset=RELEASE_KEYS)
+        releases['ReleaseDate'] = pd.to_datetime(releases['ReleaseDate'], errors='coerce')
+        releases = add_address_columns(releases).reset_index(drop=True)
+
+    print(f"Total Bookings Records: {len(bookings)} ({len(booking_events)} booking events)")
+    print(f"Total Releases Records: {len(releases)}")
+
+    return {
+        'bookings': bookings,
+        'booking_events': booking_events,
+        'releases': releases,
+        'booking_missing': booking_missing,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Sharing frames between processes
+# ---------------------------------------------------------------------------
+
+def _arrow_safe(df):
+    """
+    Converts object columns holding mixed types (e.g. a column read as int
+    from one file and as str from another) to strings so Arrow accepts them.
+    """
+    df = df.copy(deep=False)
+    for col in df.select_dtypes(include=['object', 'string']).columns:
+        if pd.api.types.infer_dtype(df[col], skipna=True) not in ('string', 'empty'):
+            df[col] = df[col].where(df[col].isna(), df[col].astype(str))
+    return df
+
+
+def share_frames(frames, directory):
+    """
+    Writes each frame as an Arrow IPC file and returns {name: path}.
+    The files are memory-mapped by the workers, so the data is read from
+    the page cache rather than being pickled through the pool's pipes.
+    """
+    paths = {}
+    for name, df in frames.items():
+        table = pa.Table.from_pandas(_arrow_safe(df), preserve_index=False)
+        path = os.path.join(directory, f"{name}.arrow")
+        with pa.OSFile(path, 'wb') as sink:
+            with pa.ipc.new_file(sink, table.schema) as writer:
+                writer.write_table(table)
+        paths[name] = path
+    return paths
+
+
+def open_frame(path):
+    """Memory-maps a frame written by share_frames()."""
+    with pa.memory_map(path, 'r') as source:
+        return pa.ipc.open_file(source).read_all().to_pandas()
+
+
+# ---------------------------------------------------------------------------
+# Output helpers
+# ---------------------------------------------------------------------------
+
+class ReportWriter:
+    """Writes a report's tables and figures into its own directory."""
+
+    def __init__(self, directory):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        self.files = []
+
+    def table(self, name, data, index=True):
+        path = os.path.join(self.directory, f"{name}.csv")
+        data.to_csv(path, index=index)
+        self.files.append(path)
+
+    def figure(self, name, fig=None):
+        fig = fig or plt.gcf()
+        path = os.path.join(self.directory, f"{name}.png")
+        fig.savefig(path, bbox_inches='tight')
+        plt.close(fig)
+        self.files.append(path)
+
+
+# ---------------------------------------------------------------------------
+# Reports
+# ---------------------------------------------------------------------------
+
+def report_population_flow(out, bookings, releases):
+    """Population_Flow_Analysis.ipynb"""
+    if bookings.empty or releases.empty:
+        print("population_flow: bookings or releases missing, skipping.")
+        return
+
+    # Daily flow
+    daily_bookings = bookings.groupby('ConfineDate')['SONumber'].nunique().rename('Bookings')
+    daily_releases = releases.groupby('ReleaseDate')['SONumber'].nunique().rename('Releases')
+    flow_df = pd.concat([daily_bookings, daily_releases], axis=1).fillna(0)
+    flow_df['Net Change'] = flow_df['Bookings'] - flow_df['Releases']
+    out.table('daily_flow', flow_df)
+
+    plt.figure(figsize=(14, 7))
+    plt.plot(flow_df.index, flow_df['Bookings'], label='Intake (Bookings)', marker='o', linestyle='-')
+    plt.plot(flow_df.index, flow_df['Releases'], label='Outflow (Releases)', marker='x', linestyle='--')
+    plt.title('Daily Jail Population Flow: Bookings vs. Releases')
+    plt.xlabel('Date')
+    plt.ylabel('Count')
+    plt.legend()
+    plt.xticks(rotation=45)
+    plt.tight_layout()
+    out.figure('daily_flow')
+
+    # Length of stay
+    b_subset = bookings[['SONumber', 'ConfineDate']].dropna().sort_values('ConfineDate')
+    r_subset = releases[['SONumber', 'ReleaseDate']].dropna().sort_values('ReleaseDate')
+    merged = pd.merge(r_subset, b_subset, on='SONumber', how='inner')
+    merged = merged[merged['ConfineDate'] <= merged['ReleaseDate']].copy()
+    merged['LoS_Days'] = (merged['ReleaseDate'] - merged['ConfineDate']).dt.days
+    matched_stays = merged.sort_values('LoS_Days').drop_duplicates(subset=['SONumber', 'ReleaseDate'], keep='first')
+    out.table('length_of_stay_stats', matched_stays['LoS_Days'].describe())
+
+    plt.figure(figsize=(10, 6))
+    sns.histplot(matched_stays['LoS_Days'], bins=30, kde=True)
+    plt.title('Distribution of Length of Stay (Days)')
+    plt.xlabel('Days')
+    out.figure('length_of_stay')
+
+    # Recidivism
+    recidivism_counts = bookings.groupby('SONumber')['ConfineDate'].nunique().sort_values(ascending=False)
+    repeat_offenders = recidivism_counts[recidivism_counts > 1].rename('BookingDates')
+    out.table('repeat_offenders', repeat_offenders)
+
+    # Marijuana possession composition
+    marijuana_bookings = bookings[bookings['ChargeOffenseDescription'] == MARIJUANA_CHARGE][['SONumber', 'ConfineDate']].drop_duplicates()
+    all_charges = pd.merge(bookings, marijuana_bookings, on=['SONumber', 'ConfineDate'], how='inner')
+    charges_per_booking = all_charges.groupby(['SONumber', 'ConfineDate']).size()
+    sole = int((charges_per_booking == 1).sum())
+    multi = int((charges_per_booking > 1).sum())
+    if sole + multi == 0:
+        return
+
+    out.table('marijuana_composition', pd.Series({'Sole Offense': sole, 'Multi-Charge': multi}, name='Bookings'))
+
+    plt.figure(figsize=(6, 6))
+    plt.pie([sole, multi], labels=['Sole Offense', 'Multi-Charge'], autopct='%1.1f%%', colors=['lightgreen', 'tomato'])
+    plt.title(f"Booking Composition for {MARIJUANA_CHARGE}")
+    out.figure('marijuana_composition')
+
+    if multi:
+        other_charges = all_charges[all_charges['ChargeOffenseDescription'] != MARIJUANA_CHARGE]
+        top_accompanying = other_charges['ChargeOffenseDescription'].value_counts().head(10)
+        out.table('marijuana_accompanying_charges', top_accompanying)
+
+        plt.figure(figsize=(10, 6))
+        sns.barplot(y=top_accompanying.index, x=top_accompanying.values, hue=top_accompanying.index, legend=False, palette='viridis')
+        plt.title("Top Charges Accompanying Marijuana Possession")
+        plt.xlabel("Count")
+        out.figure('marijuana_accompanying_charges')
+
+
+def report_geospatial(out, booking_events):
+    """Geospatial_Analysis.ipynb"""
+    data = booking_events
+    if data.empty:
+        print("geospatial: no bookings, skipping.")
+        return
+
+    top_zips = data['ZipCode'].value_counts().head(20)
+    out.table('top_zip_codes', top_zips)
+
+    plt.figure(figsize=(14, 6))
+    sns.barplot(x=top_zips.index, y=top_zips.values, hue=top_zips.index, legend=False, palette='viridis')
+    plt.title('Top 20 Zip Codes by Number of Bookings')
+    plt.xlabel('Zip Code')
+    plt.ylabel('Count')
+    plt.xticks(rotation=45)
+    out.figure('top_zip_codes')
+
+    top_zips_homeless = data[data['IsHomeless']]['ZipCode'].value_counts().head(10)
+    top_zips_housed = data[~data['IsHomeless']]['ZipCode'].value_counts().head(10)
+    out.table('top_zip_codes_homeless', top_zips_homeless)
+    out.table('top_zip_codes_housed', top_zips_housed)
+
+    fig, axes = plt.subplots(1, 2, figsize=(16, 6))
+    sns.barplot(x=top_zips_homeless.index, y=top_zips_homeless.values, ax=axes[0], hue=top_zips_homeless.index, legend=False, palette='Oranges_r')
+    axes[0].set_title('Top Zip Codes: Homeless Bookings')
+    axes[0].tick_params(axis='x', rotation=45)
+    sns.barplot(x=top_zips_housed.index, y=top_zips_housed.values, ax=axes[1], hue=top_zips_housed.index, legend=False, palette='Blues_r')
+    axes[1].set_title('Top Zip Codes: Housed Bookings')
+    axes[1].tick_params(axis='x', rotation=45)
+    plt.tight_layout()
+    out.figure('zip_codes_by_housing', fig)
+
+    # The notebook's interactive prompt is skipped; analyze the busiest zip code
+    if top_zips.empty:
+        return
+    target_zip = str(top_zips.index[0])
+    zip_data = data[data['ZipCode'] == target_zip]
+    top_crimes = zip_data['ChargeOffenseDescription'].value_counts().head(10)
+    out.table(f'top_offenses_{target_zip}', top_crimes)
+
+    plt.figure(figsize=(10, 6))
+    sns.barplot(y=top_crimes.index, x=top_crimes.values, hue=top_crimes.index, legend=False, palette='rocket')
+    plt.title(f'Top Offenses in Zip Code {target_zip}')
+    plt.xlabel('Count')
+    out.figure(f'top_offenses_{target_zip}')
+
+
+def report_data_quality(out, booking_events, releases, booking_missing):
+    """Data_Quality_Analysis.ipynb"""
+    bookings = booking_events
+    if bookings.empty:
+        print("data_quality: no bookings, skipping.")
+        return
+
+    missing_pct = booking_missing.set_index('Column')['PercentMissing']
+    missing_pct = missing_pct[missing_pct > 0].sort_values(ascending=False)
+    out.table('missing_values', missing_pct.rename('PercentMissing'))
+
+    plt.figure(figsize=(10, 5))
+    sns.barplot(x=missing_pct.index, y=missing_pct.values, hue=missing_pct.index, legend=False, palette='Reds_r')
+    plt.title('Percentage of Missing Values by Column (Bookings)')
+    plt.ylabel('Percent Missing')
+    plt.xticks(rotation=45)
+    out.figure('missing_values')
+
+    if 'AttorneyName' in bookings.columns:
+        has_attorney = bookings['AttorneyName'].notna().value_counts()
+        labels = ['Attorney Listed' if listed else 'No Attorney Listed' for listed in has_attorney.index]
+        out.table('attorney_representation', has_attorney.rename('Bookings'))
+
+        plt.figure(figsize=(6, 6))
+        plt.pie(has_attorney, labels=labels, autopct='%1.1f%%', colors=['lightgray', 'lightblue'])
+        plt.title('Attorney Representation at Booking')
+        out.figure('attorney_representation')
+
+        top_attorneys = bookings['AttorneyName'].value_counts().head(10)
+        if not top_attorneys.empty:
+            out.table('top_attorneys', top_attorneys)
+
+            plt.figure(figsize=(10, 6))
+            sns.barplot(y=top_attorneys.index, x=top_attorneys.values, hue=top_attorneys.index, legend=False, palette='viridis')
+            plt.title('Top 10 Attorneys by Case Volume')
+            plt.xlabel('Cases')
+            out.figure('top_attorneys')
+
+    if 'Court' in bookings.columns:
+        top_courts = bookings['Court'].value_counts().head(15)
+        out.table('top_courts', top_courts)
+
+        plt.figure(figsize=(12, 8))
+        sns.barplot(y=top_courts.index, x=top_courts.values, hue=top_courts.index, legend=False, palette='coolwarm')
+        plt.title('Top 15 Courts by Booking Volume')
+        plt.xlabel('Number of Cases')
+        out.figure('top_courts')
+
+    if 'ReleaseTime' in releases.columns:
+        # Format is typically like '11:10 PM'
+        release_hour = pd.to_datetime(releases['ReleaseTime'], format='%I:%M %p', errors='coerce').dt.hour
+        hourly_counts = release_hour.value_counts().sort_index()
+        out.table('releases_by_hour', hourly_counts.rename('Releases'))
+
+        plt.figure(figsize=(12, 6))
+        sns.lineplot(x=hourly_counts.index, y=hourly_counts.values, marker='o', color='green')
+        plt.title('Release Volume by Hour of Day')
+        plt.xlabel('Hour (24h)')
+        plt.ylabel('Number of Releases')
+        plt.xticks(range(0, 24))
+        plt.grid(True)
+        out.figure('releases_by_hour')
+    else:
+        print("data_quality: ReleaseTime column not found.")
+
+
+def homeless_summary(df, homeless_df):
+    """Record and unique-individual counts, as printed by homeless_analysis.py."""
+    total_unique = df['SONumber'].nunique()
+    unique_homeless = homeless_df['SONumber'].nunique()
+    return {
+        'HomelessRecords': len(homeless_df),
+        'UniqueHomeless': unique_homeless,
+        'PercentUniqueHomeless': unique_homeless / total_unique * 100 if total_unique > 0 else None,
+    }
+
+
+def report_homelessness(out, booking_events, releases):
+    """Homelessness_Analysis.ipynb and homeless_analysis.py"""
+    data = booking_events
+    if data.empty:
+        print("homelessness: no bookings, skipping.")
+        return
+
+    homeless_counts = data['IsHomeless'].value_counts()
+    homeless = int(homeless_counts.get(True, 0))
+    housed = int(homeless_counts.get(False, 0))
+    out.table('homeless_proportion', pd.Series({'Homeless': homeless, 'Housed': housed}, name='Bookings'))
+
+    plt.figure(figsize=(6, 6))
+    plt.pie([homeless, housed], labels=['Homeless', 'Housed'], autopct='%1.1f%%', colors=['orange', 'lightblue'])
+    plt.title('Proportion of Homeless Bookings')
+    out.figure('homeless_proportion')
+
+    top_homeless = data[data['IsHomeless']]['ChargeOffenseDescription'].value_counts().head(10)
+    top_housed = data[~data['IsHomeless']]['ChargeOffenseDescription'].value_counts().head(10)
+    out.table('top_charges_homeless', top_homeless)
+    out.table('top_charges_housed', top_housed)
+
+    fig, axes = plt.subplots(1, 2, figsize=(16, 8))
+    sns.barplot(y=top_homeless.index, x=top_homeless.values, ax=axes[0], hue=top_homeless.index, legend=False, palette='Oranges_r')
+    axes[0].set_title('Top Charges: Homeless')
+    axes[0].set_xlabel('Count')
+    sns.barplot(y=top_housed.index, x=top_housed.values, ax=axes[1], hue=top_housed.index, legend=False, palette='Blues_r')
+    axes[1].set_title('Top Charges: Housed')
+    axes[1].set_xlabel('Count')
+    plt.tight_layout()
+    out.figure('top_charges_by_housing', fig)
+
+    if 'BondAmount_Clean' in data.columns:
+        out.table('median_bond', data.groupby('IsHomeless')['BondAmount_Clean'].median())
+
+    if 'BondType' in data.columns:
+        bond_types = data.groupby(['IsHomeless', 'BondType']).size().unstack(fill_value=0)
+        bond_types_pct = bond_types.div(bond_types.sum(axis=1), axis=0) * 100
+    else:
+        bond_types_pct = pd.DataFrame()
+
+    if not bond_types_pct.empty:
+        out.table('bond_type_distribution', bond_types_pct)
+
+        ax = bond_types_pct.plot(kind='bar', stacked=True, figsize=(10, 6), cmap='viridis')
+        ax.set_title('Bond Type Distribution by Housing Status')
+        ax.set_ylabel('Percentage')
+        ax.set_xticklabels(['Homeless' if h else 'Housed' for h in bond_types_pct.index], rotation=0)
+        ax.legend(bbox_to_anchor=(1.05, 1), loc='upper left')
+        plt.tight_layout()
+        out.figure('bond_type_distribution', ax.figure)
+
+    daily_homeless = data[data['IsHomeless']].groupby('ConfineDate').size().rename('Bookings')
+    out.table('daily_homeless_bookings', daily_homeless)
+
+    plt.figure(figsize=(12, 5))
+    daily_homeless.plot(marker='o', color='orange')
+    plt.title('Daily Homeless Bookings')
+    plt.ylabel('Count')
+    out.figure('daily_homeless_bookings')
+
+    # Address and zip code breakdown from homeless_analysis.py
+    homeless_bookings = data[data['IsHomeless']]
+    out.table('homeless_address_variations', homeless_bookings['Address1'].value_counts().head(5))
+    out.table('homeless_zip_codes_bookings', homeless_bookings['ZipCode'].value_counts().head(10))
+
+    summary = {'Bookings': homeless_summary(data, homeless_bookings)}
+    if 'IsHomeless' in releases.columns:
+        homeless_releases = releases[releases['IsHomeless']]
+        out.table('homeless_zip_codes_releases', homeless_releases['ZipCode'].value_counts().head(10))
+        summary['Releases'] = homeless_summary(releases, homeless_releases)
+    out.table('homeless_individuals', pd.DataFrame.from_dict(summary, orient='index'))
+
+
+def report_charges(out, bookings, releases):
+    """Charge_Analysis.ipynb (the search widget is interactive-only)"""
+    charges = []
+    if 'ChargeOffenseDescription' in bookings.columns:
+        charges.append(bookings['ChargeOffenseDescription'])
+    if 'OffenseDescription' in releases.columns:
+        charges.append(releases['OffenseDescription'])
+    if not charges:
+        print("charges: no data available for summary.")
+        return
+
+    charge_summary = pd.concat(charges, ignore_index=True).fillna('').value_counts().reset_index()
+    charge_summary.columns = ['Charge', 'Count']
+    out.table('charge_summary', charge_summary, index=False)
+
+
+# name -> (report function, frames it needs)
+REPORTS = {
+    'population_flow': (report_population_flow, ['bookings', 'releases']),
+    'geospatial': (report_geospatial, ['booking_events']),
+    'data_quality': (report_data_quality, ['booking_events', 'releases', 'booking_missing']),
+    'homelessness': (report_homelessness, ['booking_events', 'releases']),
+    'charges': (report_charges, ['bookings', 'releases']),
+}
+
+
+# ---------------------------------------------------------------------------
+# Execution
+# ---------------------------------------------------------------------------
+
+def run_report(name, frame_paths, output_dir):
+    """
+    Worker entry point: maps the shared frames, runs one report and returns
+    (name, files written, seconds elapsed).
+    """
+    start = time.time()
+    sns.set_theme(style="whitegrid")
+    plt.rcParams['figure.figsize'] = (12, 6)
+
+    func, frame_names = REPORTS[name]
+    frames = {f: open_frame(frame_paths[f]) for f in frame_names}
+    out = ReportWriter(os.path.join(output_dir, name))
+    func(out, **frames)
+    return name, out.files, time.time() - start
+
+
+def run_reports(names, output_dir, workers=None):
+    """Loads the dataset once and runs the selected reports in parallel."""
+    start = time.time()
+    frames = load_dataset()
+    if frames['bookings'].empty and frames['releases'].empty:
+        print("No data loaded.")
+        return False
+    print(f"Dataset loaded in {time.time() - start:.1f}s")
+
+    os.makedirs(output_dir, exist_ok=True)
+    scratch_root = '/dev/shm' if os.path.isdir('/dev/shm') else None
+    failed = []
+
+    with tempfile.TemporaryDirectory(prefix='bexar_reports_', dir=scratch_root) as scratch:
+        frame_paths = share_frames(frames, scratch)
+        del frames
+
+        with ProcessPoolExecutor(max_workers=workers or min(len(names), os.cpu_count() or 1)) as pool:
+            futures = {pool.submit(run_report, name, frame_paths, output_dir): name for name in names}
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    _, files, elapsed = future.result()
+                    print(f"[{name}] wrote {len(files)} files in {elapsed:.1f}s")
+                except Exception as e:
+                    # The worker's traceback is chained onto e by concurrent.futures
+                    details = ''.join(traceback.format_exception(e))
+                    error_dir = os.path.join(output_dir, name)
+                    os.makedirs(error_dir, exist_ok=True)
+                    with open(os.path.join(error_dir, 'error.txt'), 'w') as f:
+                        f.write(details)
+                    print(f"[{name}] FAILED: {e}\n{details}")
+                    failed.append(name)
+
+    print(f"Finished {len(names) - len(failed)}/{len(names)} reports in {time.time() - start:.1f}s -> {output_dir}")
+    return not failed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run the Bexar analysis reports headlessly.")
+    parser.add_argument('reports', nargs='*', metavar='report',
+                        help=f"Reports to run (default: all). Choices: {', '.join(REPORTS)}")
+    parser.add_argument('-o', '--output', default='reports', help="Output directory (default: reports)")
+    parser.add_argument('-w', '--workers', type=int, default=None, help="Worker processes (default: one per report, up to CPU count)")
+    args = parser.parse_args()
+
+    unknown = [r for r in args.reports if r not in REPORTS]
+    if unknown:
+        parser.error(f"unknown report(s): {', '.join(unknown)}")
+
+    names = args.reports or list(REPORTS)
+    sys.exit(0 if run_reports(names, args.output, args.workers) else 1)
+
+
+if __name__ == "__main__":
+    main()